@@ -18,27 +18,106 @@ import argparse
 import os
 import sys
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # headless backend; workers must not touch a GUI
+matplotlib.rcParams["figure.max_open_warning"] = 0
+matplotlib.rcParams["path.simplify_threshold"] = 1.0  # cheaper line rendering
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+plt.ioff()
 sns.set(style="whitegrid")
 
 # Get the directory where the script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Shared savefig options: low PNG compression, no optimize passes.
+# These plots are tiny, so compression time dominates encoding otherwise.
+SAVE_KW = dict(dpi=100, pil_kwargs={"compress_level": 1, "optimize": False})
+
+# Source CSV for the current run; set in main (and in each plot worker) so
+# plot functions can compare mtimes against their output PNGs.
+CSV_PATH = None
+
+_FIG = None
+
+
+def _fresh(path):
+    # A plot is fresh if it already exists and is newer than the source CSV
+    return (
+        CSV_PATH is not None
+        and os.path.exists(path)
+        and os.path.exists(CSV_PATH)
+        and os.path.getmtime(path) > os.path.getmtime(CSV_PATH)
+    )
+
+
+def _get_fig(figsize):
+    # Reuse a single Figure per process: creating one from scratch pays
+    # figure construction + font cache warmup for every plot.
+    global _FIG
+    if _FIG is None:
+        _FIG = plt.figure()
+    _FIG.clear()
+    _FIG.set_size_inches(*figsize)
+    ax = _FIG.add_subplot(111)
+    return _FIG, ax
+
+
 def ensure_dirs():
     os.makedirs(os.path.join(SCRIPT_DIR, "plots"), exist_ok=True)
     os.makedirs(os.path.join(SCRIPT_DIR, "output"), exist_ok=True)
 
 
+# Only the columns the analysis actually touches; skipping the rest
+# (notably the wide 'description') saves tokenization and memory.
+CSV_USECOLS = [
+    "type",
+    "title",
+    "director",
+    "cast",
+    "country",
+    "date_added",
+    "rating",
+    "duration",
+    "listed_in",
+]
+
+# Explicit dtypes so read_csv skips type inference. 'type' and 'rating' stay
+# plain strings here because clean_data fills missing values with 'Unknown'
+# before any categorical treatment.
+CSV_DTYPES = {c: "string" for c in CSV_USECOLS if c != "date_added"}
+
+
 def read_data(csv_path: str) -> pd.DataFrame:
     if not os.path.exists(csv_path):
         print(f"ERROR: CSV file not found at {csv_path}")
         sys.exit(1)
-    df = pd.read_csv(csv_path)
+    try:
+        # Arrow's CSV reader tokenizes on multiple threads
+        df = pd.read_csv(
+            csv_path,
+            engine="pyarrow",
+            usecols=CSV_USECOLS,
+            dtype=CSV_DTYPES,
+            parse_dates=["date_added"],
+        )
+    except ImportError:
+        # pyarrow not installed -> plain C engine
+        df = pd.read_csv(
+            csv_path,
+            engine="c",
+            low_memory=False,
+            usecols=CSV_USECOLS,
+            dtype=CSV_DTYPES,
+            parse_dates=["date_added"],
+            date_format="%B %d, %Y",
+            cache_dates=True,
+        )
     return df
 
 
@@ -48,209 +127,228 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     # Standardize column names
     df.columns = [c.strip() for c in df.columns]
 
-    # Parse dates
+    # Parse dates (read_data may have parsed them already via parse_dates)
     if "date_added" in df.columns:
-        df["date_added"] = pd.to_datetime(df["date_added"], errors="coerce")
-        df["year_added"] = df["date_added"].dt.year
+        if not pd.api.types.is_datetime64_any_dtype(df["date_added"]):
+            # the CSV uses e.g. 'September 25, 2021'; an explicit format
+            # takes the C fast path instead of per-value format inference
+            df["date_added"] = pd.to_datetime(
+                df["date_added"].astype("string").str.strip(),
+                format="%B %d, %Y",
+                errors="coerce",
+            )
+        # Int16 (nullable) instead of the float64 that NaT would force
+        df["year_added"] = df["date_added"].dt.year.astype("Int16")
+        # only the year is ever used again; drop the 8-byte/row datetimes
+        df.drop(columns=["date_added"], inplace=True)
     else:
         df["year_added"] = np.nan
 
-    # Fill missing simple text columns with 'Unknown'
-    for col in ["director", "cast", "country", "rating"]:
-        if col in df.columns:
-            df[col] = df[col].fillna("Unknown")
+    # Fill missing simple text columns with 'Unknown' in a single fillna call
+    defaults = {c: "Unknown" for c in ("director", "cast", "country", "rating", "listed_in")}
+    df.fillna({c: v for c, v in defaults.items() if c in df.columns}, inplace=True)
 
-    # Normalize 'type' column (Movie / TV Show)
+    # Normalize 'type' column (Movie / TV Show) so downstream code can
+    # compare with eq() instead of lowercasing the whole column
     if "type" in df.columns:
-        df["type"] = df["type"].str.strip()
+        df["type"] = df["type"].str.strip().str.title().str.replace("Tv Show", "TV Show")
 
-    # Split listed_in into list (genres/categories)
-    if "listed_in" in df.columns:
-        df["listed_in"] = df["listed_in"].fillna("Unknown")
-        df["genres_list"] = df["listed_in"].apply(lambda x: [g.strip() for g in str(x).split(",")])
-    else:
-        df["genres_list"] = [[] for _ in range(len(df))]
-
-    # Parse duration: for Movies -> minutes; for TV Shows -> seasons
-    def parse_duration(x):
-        if pd.isna(x):
-            return np.nan
-        s = str(x).strip()
-        # Examples: '90 min' or '2 Seasons' or '1 Season'
-        try:
-            if "min" in s:
-                return int(s.split()[0])
-            else:
-                # seasons -> return number of seasons
-                return int(s.split()[0])
-        except Exception:
-            return np.nan
+    # Keep listed_in as the raw comma-separated string; plot_top_genres
+    # splits it on demand, so no per-row Python lists get materialized here
+    if "listed_in" not in df.columns:
+        df["listed_in"] = "Unknown"
 
+    # Parse duration: for Movies -> minutes; for TV Shows -> seasons.
+    # Examples: '90 min' or '2 Seasons' or '1 Season' -> just grab the number.
     if "duration" in df.columns:
-        df["duration_parsed"] = df["duration"].apply(parse_duration)
+        df["duration_parsed"] = df["duration"].str.extract(r"(\d+)", expand=False).astype("Int32")
+        # raw duration strings are fully replaced by duration_parsed
+        df.drop(columns=["duration"], inplace=True)
     else:
         df["duration_parsed"] = np.nan
 
     # Clean country: take first country if multiple listed
     if "country" in df.columns:
-        df["primary_country"] = df["country"].apply(lambda x: str(x).split(",")[0].strip() if pd.notna(x) and x != "Unknown" else "Unknown")
+        # n=1 stops splitting after the first comma; keep the 'Unknown' sentinel
+        df["primary_country"] = (
+            df["country"].str.split(",", n=1).str[0].str.strip()
+            .mask(df["country"].eq("Unknown"), "Unknown")
+        )
     else:
         df["primary_country"] = "Unknown"
 
+    # Low-cardinality text columns -> category: 4-byte codes instead of object
+    # pointers, and value_counts/idxmax downstream operate on int codes.
+    for col in ("type", "rating", "primary_country"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
     return df
 
 
 def plot_movies_vs_tv(df: pd.DataFrame):
-    fig, ax = plt.subplots(figsize=(6, 4))
-    order = df["type"].value_counts().index
-    sns.countplot(data=df, x="type", order=order, ax=ax)
+    path = os.path.join(SCRIPT_DIR, "plots", "movies_vs_tv.png")
+    if _fresh(path):
+        print(f"Skipping {path} (up to date)")
+        return
+    # plot the value_counts directly; countplot would re-group the frame
+    vc = df["type"].value_counts()
+    fig, ax = _get_fig((6, 4))
+    ax.bar(vc.index.astype(str), vc.values)
     ax.set_title("Movies vs TV Shows on Netflix")
     ax.set_xlabel("")
     ax.set_ylabel("Count")
     plt.tight_layout()
-    path = os.path.join(SCRIPT_DIR, "plots", "movies_vs_tv.png")
-    fig.savefig(path)
-    plt.close(fig)
+    fig.savefig(path, **SAVE_KW)
     print(f"Saved {path}")
 
 
 def plot_top_genres(df: pd.DataFrame, top_n=12):
-    # explode genres_list
-    all_genres = Counter()
-    for gl in df["genres_list"]:
-        for g in gl:
-            all_genres[g] += 1
-    top = all_genres.most_common(top_n)
-    genres, counts = zip(*top)
-
-    fig, ax = plt.subplots(figsize=(8, 5))
+    path = os.path.join(SCRIPT_DIR, "plots", "top_genres.png")
+    if _fresh(path):
+        print(f"Skipping {path} (up to date)")
+        return
+    # split + explode the raw listed_in strings and count in one C pass
+    top = df["listed_in"].str.split(",").explode().str.strip().value_counts().head(top_n)
+    genres, counts = top.index.tolist(), top.values.tolist()
+
+    fig, ax = _get_fig((8, 5))
     sns.barplot(x=list(counts), y=list(genres), ax=ax)
     ax.set_title(f"Top {top_n} Genres / Categories")
     ax.set_xlabel("Count")
     ax.set_ylabel("")
     plt.tight_layout()
-    path = os.path.join(SCRIPT_DIR, "plots", "top_genres.png")
-    fig.savefig(path)
-    plt.close(fig)
+    fig.savefig(path, **SAVE_KW)
     print(f"Saved {path}")
 
 
 def plot_yearly_trend(df: pd.DataFrame):
+    path = os.path.join(SCRIPT_DIR, "plots", "content_added_per_year.png")
+    if _fresh(path):
+        print(f"Skipping {path} (up to date)")
+        return
     if "year_added" not in df.columns or df["year_added"].isna().all():
         print("No year_added information available to plot yearly trend.")
         return
-    series = df["year_added"].dropna().astype(int).value_counts().sort_index()
-    fig, ax = plt.subplots(figsize=(8, 4))
+    series = df["year_added"].dropna().astype("int16").value_counts().sort_index()
+    fig, ax = _get_fig((8, 4))
     series.plot(ax=ax)
     ax.set_title("Content Added to Netflix Over Years")
     ax.set_xlabel("Year")
     ax.set_ylabel("Number of Titles Added")
     plt.tight_layout()
-    path = os.path.join(SCRIPT_DIR, "plots", "content_added_per_year.png")
-    fig.savefig(path)
-    plt.close(fig)
+    fig.savefig(path, **SAVE_KW)
     print(f"Saved {path}")
 
 
 def plot_top_countries(df: pd.DataFrame, top_n=10):
+    path = os.path.join(SCRIPT_DIR, "plots", "top_countries.png")
+    if _fresh(path):
+        print(f"Skipping {path} (up to date)")
+        return
     counts = df["primary_country"].value_counts().head(top_n)
-    fig, ax = plt.subplots(figsize=(8, 4))
-    sns.barplot(x=counts.values, y=counts.index, ax=ax)
+    fig, ax = _get_fig((8, 4))
+    ax.barh(counts.index[::-1].astype(str), counts.values[::-1])
     ax.set_title(f"Top {top_n} Countries by Number of Titles")
     ax.set_xlabel("Number of Titles")
     ax.set_ylabel("")
     plt.tight_layout()
-    path = os.path.join(SCRIPT_DIR, "plots", "top_countries.png")
-    fig.savefig(path)
-    plt.close(fig)
+    fig.savefig(path, **SAVE_KW)
     print(f"Saved {path}")
 
 
 def plot_rating_distribution(df: pd.DataFrame, top_n=20):
+    path = os.path.join(SCRIPT_DIR, "plots", "rating_distribution.png")
+    if _fresh(path):
+        print(f"Skipping {path} (up to date)")
+        return
     if "rating" not in df.columns:
         print("No rating column present")
         return
     counts = df["rating"].value_counts().head(top_n)
-    fig, ax = plt.subplots(figsize=(8, 6))
-    sns.barplot(x=counts.values, y=counts.index, ax=ax)
+    fig, ax = _get_fig((8, 6))
+    ax.barh(counts.index[::-1].astype(str), counts.values[::-1])
     ax.set_title("Content Ratings Distribution")
     ax.set_xlabel("Count")
     ax.set_ylabel("")
     plt.tight_layout()
-    path = os.path.join(SCRIPT_DIR, "plots", "rating_distribution.png")
-    fig.savefig(path)
-    plt.close(fig)
+    fig.savefig(path, **SAVE_KW)
     print(f"Saved {path}")
 
 
 def duration_insights(df: pd.DataFrame):
-    movies = df[df["type"].str.lower() == "movie"] if "type" in df.columns else df
-    shows = df[df["type"].str.lower() == "tv show"] if "type" in df.columns else pd.DataFrame()
+    movies = df[df["type"].eq("Movie")] if "type" in df.columns else df
+    shows = df[df["type"].eq("TV Show")] if "type" in df.columns else pd.DataFrame()
 
     # Movies - minutes distribution
-    if not movies.empty and "duration_parsed" in movies.columns:
+    path = os.path.join(SCRIPT_DIR, "plots", "movie_duration_distribution.png")
+    if _fresh(path):
+        print(f"Skipping {path} (up to date)")
+    elif not movies.empty and "duration_parsed" in movies.columns:
         m = movies["duration_parsed"].dropna()
         if not m.empty:
-            fig, ax = plt.subplots(figsize=(8, 4))
+            fig, ax = _get_fig((8, 4))
             sns.histplot(m, bins=30, kde=False, ax=ax)
             ax.set_title("Distribution of Movie Durations (minutes)")
             ax.set_xlabel("Minutes")
             plt.tight_layout()
-            path = os.path.join(SCRIPT_DIR, "plots", "movie_duration_distribution.png")
-            fig.savefig(path)
-            plt.close(fig)
+            fig.savefig(path, **SAVE_KW)
             print(f"Saved {path}")
 
     # Shows - seasons distribution
-    if not shows.empty and "duration_parsed" in shows.columns:
+    path = os.path.join(SCRIPT_DIR, "plots", "show_seasons_count.png")
+    if _fresh(path):
+        print(f"Skipping {path} (up to date)")
+    elif not shows.empty and "duration_parsed" in shows.columns:
         s = shows["duration_parsed"].dropna()
         if not s.empty:
-            fig, ax = plt.subplots(figsize=(8, 4))
+            fig, ax = _get_fig((8, 4))
             sns.countplot(x=s, ax=ax)
             ax.set_title("Number of Seasons for TV Shows")
             ax.set_xlabel("Seasons")
             plt.tight_layout()
-            path = os.path.join(SCRIPT_DIR, "plots", "show_seasons_count.png")
-            fig.savefig(path)
-            plt.close(fig)
+            fig.savefig(path, **SAVE_KW)
             print(f"Saved {path}")
 
 
 def top_directors_actors(df: pd.DataFrame, top_n=10):
     # Directors
-    directors = df["director"].dropna().astype(str)
-    directors = directors[directors != "Unknown"]
-    if not directors.empty:
-        dir_counts = directors.value_counts().head(top_n)
-        fig, ax = plt.subplots(figsize=(8, 4))
-        sns.barplot(x=dir_counts.values, y=dir_counts.index, ax=ax)
-        ax.set_title(f"Top {top_n} Directors by Number of Titles")
-        ax.set_xlabel("Number of Titles")
-        plt.tight_layout()
-        path = os.path.join(SCRIPT_DIR, "plots", "top_directors.png")
-        fig.savefig(path)
-        plt.close(fig)
-        print(f"Saved {path}")
-
-    # Actors: explode cast
-    if "cast" in df.columns:
-        casts = df["cast"].dropna().astype(str)
-        actor_counter = Counter()
-        for c in casts:
-            for actor in [a.strip() for a in c.split(",")][:5]:  # only first 5 to avoid extremely long lists
-                if actor:
-                    actor_counter[actor] += 1
-        top_actors = actor_counter.most_common(top_n)
-        if top_actors:
-            actors, counts = zip(*top_actors)
-            fig, ax = plt.subplots(figsize=(8, 4))
+    path = os.path.join(SCRIPT_DIR, "plots", "top_directors.png")
+    if _fresh(path):
+        print(f"Skipping {path} (up to date)")
+    else:
+        directors = df["director"].dropna().astype(str)
+        directors = directors[directors != "Unknown"]
+        if not directors.empty:
+            dir_counts = directors.value_counts().head(top_n)
+            fig, ax = _get_fig((8, 4))
+            sns.barplot(x=dir_counts.values, y=dir_counts.index, ax=ax)
+            ax.set_title(f"Top {top_n} Directors by Number of Titles")
+            ax.set_xlabel("Number of Titles")
+            plt.tight_layout()
+            fig.savefig(path, **SAVE_KW)
+            print(f"Saved {path}")
+
+    # Actors: explode cast (only first 5 per title to avoid extremely long lists)
+    path = os.path.join(SCRIPT_DIR, "plots", "top_actors.png")
+    if _fresh(path):
+        print(f"Skipping {path} (up to date)")
+    elif "cast" in df.columns:
+        cast_series = (
+            df["cast"].dropna().astype(str)
+            .str.split(",", expand=True).iloc[:, :5]
+            .stack().str.strip()
+        )
+        cast_series = cast_series[cast_series != ""]
+        top_actors = cast_series.value_counts().head(top_n)
+        if not top_actors.empty:
+            actors, counts = top_actors.index.tolist(), top_actors.values.tolist()
+            fig, ax = _get_fig((8, 4))
             sns.barplot(x=list(counts), y=list(actors), ax=ax)
             ax.set_title(f"Top {top_n} Actors/Actresses by Appearances (first 5 listed)")
             ax.set_xlabel("Appearances")
             plt.tight_layout()
-            path = os.path.join(SCRIPT_DIR, "plots", "top_actors.png")
-            fig.savefig(path)
-            plt.close(fig)
+            fig.savefig(path, **SAVE_KW)
             print(f"Saved {path}")
 
 
@@ -260,8 +358,11 @@ def save_summary(df: pd.DataFrame):
     if "type" in df.columns:
         summary.update(df["type"].value_counts().to_dict())
     if "year_added" in df.columns:
-        summary["earliest_year_added"] = int(df["year_added"].dropna().min()) if not df["year_added"].dropna().empty else np.nan
-        summary["latest_year_added"] = int(df["year_added"].dropna().max()) if not df["year_added"].dropna().empty else np.nan
+        # pull the column into NumPy once instead of three dropna passes
+        ya = df["year_added"].to_numpy(dtype="float64", na_value=np.nan)
+        ya = ya[~np.isnan(ya)].astype(np.int32)
+        summary["earliest_year_added"] = int(ya.min()) if ya.size else np.nan
+        summary["latest_year_added"] = int(ya.max()) if ya.size else np.nan
 
     # top country
     summary["top_country"] = df["primary_country"].value_counts().idxmax() if not df["primary_country"].empty else "Unknown"
@@ -272,19 +373,84 @@ def save_summary(df: pd.DataFrame):
     print(f"Saved summary to {out_path}")
 
 
+def stream_counts(csv_path, chunksize=100_000):
+    # Yield cleaned chunks so the whole CSV never has to fit in memory
+    for chunk in pd.read_csv(
+        csv_path,
+        engine="c",
+        usecols=CSV_USECOLS,
+        dtype=CSV_DTYPES,
+        parse_dates=["date_added"],
+        date_format="%B %d, %Y",
+        cache_dates=True,
+        chunksize=chunksize,
+    ):
+        yield clean_data(chunk)
+
+
+def run_stream(args):
+    # Memory-constrained mode: merge per-chunk counts into the summary CSV.
+    # Plots need the full dataset, so this mode produces only the summary.
+    total = 0
+    type_counts = Counter()
+    country_counts = Counter()
+    ymin = ymax = None
+    for chunk in stream_counts(args.csv):
+        total += len(chunk)
+        type_counts.update(chunk["type"].value_counts().to_dict())
+        country_counts.update(chunk["primary_country"].value_counts().to_dict())
+        ya = chunk["year_added"].dropna()
+        if not ya.empty:
+            lo, hi = int(ya.min()), int(ya.max())
+            ymin = lo if ymin is None else min(ymin, lo)
+            ymax = hi if ymax is None else max(ymax, hi)
+
+    summary = {"total_titles": total}
+    summary.update(type_counts)
+    summary["earliest_year_added"] = ymin if ymin is not None else np.nan
+    summary["latest_year_added"] = ymax if ymax is not None else np.nan
+    summary["top_country"] = country_counts.most_common(1)[0][0] if country_counts else "Unknown"
+
+    summary_df = pd.DataFrame(list(summary.items()), columns=["metric", "value"])
+    out_path = os.path.join(SCRIPT_DIR, "output", "summary_stats.csv")
+    summary_df.to_csv(out_path, index=False)
+    print(f"Saved summary to {out_path} (streaming mode, plots skipped)")
+
+
+def _plot_worker(task):
+    # Workers are fresh processes, so re-seed the CSV path for _fresh checks
+    global CSV_PATH
+    func, frame, kwargs, CSV_PATH = task
+    func(frame, **kwargs)
+
+
 def main(args):
+    global CSV_PATH
+    CSV_PATH = args.csv
     ensure_dirs()
+
+    if getattr(args, "stream", False):
+        run_stream(args)
+        return
+
     df = read_data(args.csv)
     df = clean_data(df)
 
-    # Run analyses and save plots
-    plot_movies_vs_tv(df)
-    plot_top_genres(df, top_n=args.top_genres)
-    plot_yearly_trend(df)
-    plot_top_countries(df, top_n=args.top_countries)
-    plot_rating_distribution(df)
-    duration_insights(df)
-    top_directors_actors(df, top_n=args.top_people)
+    # Each plot is independent and mostly spends its time in matplotlib
+    # rendering + PNG encoding, so fan them out to worker processes. Each
+    # task ships only the columns its plot actually reads.
+    tasks = [
+        (plot_movies_vs_tv, df[["type"]], {}, args.csv),
+        (plot_top_genres, df[["listed_in"]], {"top_n": args.top_genres}, args.csv),
+        (plot_yearly_trend, df[["year_added"]], {}, args.csv),
+        (plot_top_countries, df[["primary_country"]], {"top_n": args.top_countries}, args.csv),
+        (plot_rating_distribution, df[["rating"]], {}, args.csv),
+        (duration_insights, df[["type", "duration_parsed"]], {}, args.csv),
+        (top_directors_actors, df[["director", "cast"]], {"top_n": args.top_people}, args.csv),
+    ]
+    with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as ex:
+        list(ex.map(_plot_worker, tasks))
+
     save_summary(df)
 
     print("All done. Plots are in the ./plots directory and summary in ./output.")
@@ -295,6 +461,7 @@ if __name__ == "__main__":
         top_genres = 12
         top_countries = 10
         top_people = 10
+        stream = False  # set True to aggregate chunk-by-chunk (summary only)
 
     args = Args()
     main(args)